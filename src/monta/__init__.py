@@ -15,8 +15,10 @@ from .models import (
     Address,
     Balance,
     Charge,
+    ChargeBatch,
     ChargePoint,
     ChargeState,
+    ChargeSummary,
     Connector,
     Coordinates,
     Currency,
@@ -45,6 +47,8 @@ __all__ = [
     "TokenResponse",
     "ChargePoint",
     "Charge",
+    "ChargeBatch",
+    "ChargeSummary",
     "Wallet",
     "Balance",
     "Currency",
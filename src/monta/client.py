@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import socket
 from abc import ABC, abstractmethod
@@ -11,6 +12,11 @@ from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from .const import (
     API_BASE_URL,
     DEFAULT_TIMEOUT,
@@ -35,6 +41,9 @@ from .models import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Decode responses with orjson when installed (``pip install monta[speedups]``)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 class TokenStorage(ABC):
     """Abstract base class for token storage."""
@@ -233,7 +242,7 @@ class MontaApiClient:
             _LOGGER.warning("No charges found in response!")
             charges = []
 
-        charge_objects = [Charge.from_dict(charge) for charge in charges]
+        charge_objects = Charge.from_list(charges)
         return sorted(charge_objects, key=lambda charge: -charge.id)
 
     async def async_start_charge(self, charge_point_id: int) -> Charge:
@@ -474,13 +483,24 @@ class MontaApiClient:
                         ),
                     )
                 response.raise_for_status()
-                response_json = await response.json()
-
-                _LOGGER.debug(
-                    "[%s] Response body: %s",
-                    path,
-                    self._filter_private_information(response_json),
-                )
+                # Decode the raw bytes: response.json() would first decode
+                # the body to str, which orjson does not need.
+                body = await response.read()
+                try:
+                    response_json = _json_loads(body) if body.strip() else None
+                except ValueError as exception:
+                    raise MontaApiClientCommunicationError(
+                        "Invalid JSON in response",
+                    ) from exception
+
+                # Filtering copies the whole response, so only do it when
+                # the body is actually going to be logged.
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "[%s] Response body: %s",
+                        path,
+                        self._filter_private_information(response_json),
+                    )
 
                 return response_json
 
@@ -492,7 +512,11 @@ class MontaApiClient:
             raise MontaApiClientCommunicationError(
                 "Error fetching information",
             ) from exception
-        except (MontaApiClientAuthenticationError, MontaApiClientRateLimitError):
+        except (
+            MontaApiClientAuthenticationError,
+            MontaApiClientCommunicationError,
+            MontaApiClientRateLimitError,
+        ):
             raise
         except Exception as exception:
             raise MontaApiClientError("Something really wrong happened!") from exception